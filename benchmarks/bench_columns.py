@@ -0,0 +1,57 @@
+"""Compare usefull.columns.apply with per-row calls.
+
+Run from the repository root with: python -m benchmarks.bench_columns
+"""
+
+import random
+import string
+import timeit
+from array import array
+
+from usefull.columns import apply
+from usefull.numeric import clamp
+from usefull.text import slugify
+from usefull.validation import is_email
+
+ROWS = 100_000
+REPEAT = 5
+
+
+def _random_text(rng: random.Random) -> str:
+    return " ".join(
+        "".join(rng.choices(string.ascii_letters, k=rng.randint(2, 8)))
+        for _ in range(rng.randint(1, 5))
+    )
+
+
+def main() -> None:
+    rng = random.Random(0)
+    texts = [_random_text(rng) for _ in range(ROWS)]
+    # Half valid addresses, half plain text
+    emails = [
+        f"{text.replace(' ', '.')}@example.com" if i % 2 else text
+        for i, text in enumerate(texts)
+    ]
+    numbers = array("d", (rng.uniform(-100, 100) for _ in range(ROWS)))
+
+    cases = [
+        ("slugify", lambda: [slugify(t) for t in texts], lambda: apply(slugify, texts)),
+        ("is_email", lambda: [is_email(e) for e in emails], lambda: apply(is_email, emails)),
+        (
+            "clamp",
+            lambda: [clamp(n, -10, 10) for n in numbers],
+            lambda: apply(clamp, numbers, -10, 10),
+        ),
+    ]
+    print(f"{'function':<10} {'per-row':>10} {'columnar':>10} {'speedup':>8}  ({ROWS} rows)")
+    for name, per_row, columnar in cases:
+        row_time = min(timeit.repeat(per_row, number=1, repeat=REPEAT))
+        column_time = min(timeit.repeat(columnar, number=1, repeat=REPEAT))
+        print(
+            f"{name:<10} {row_time * 1000:>8.1f}ms {column_time * 1000:>8.1f}ms "
+            f"{row_time / column_time:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Multi-thread stress benchmark for the lock-striped accumulators.
+
+Compares ConcurrentSeenSet with a set guarded by a single global lock while
+the number of threads grows. On builds with a GIL, throughput cannot scale
+with threads; the striped version mainly avoids contention on the shared
+lock. On free-threaded builds it lets threads proceed in parallel.
+
+Run from the repository root with: python -m benchmarks.bench_concurrency
+"""
+
+import sys
+import threading
+import time
+from typing import Callable
+
+from usefull.concurrency import ConcurrentGrouper, ConcurrentSeenSet
+
+ITEMS_PER_THREAD = 200_000
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+class _GlobalLockSet:
+    def __init__(self) -> None:
+        self._items: set = set()
+        self._lock = threading.Lock()
+
+    def add(self, item: object) -> bool:
+        with self._lock:
+            if item in self._items:
+                return False
+            self._items.add(item)
+            return True
+
+
+def _timed(threads: int, work: Callable[[int], None]) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        work(index)
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    start = time.perf_counter()
+    barrier.wait()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def _add_all(target: object) -> Callable[[int], None]:
+    def work(index: int) -> None:
+        add = target.add  # type: ignore[attr-defined]
+        # Half of the keys overlap with the next thread to exercise dedup
+        start = index * ITEMS_PER_THREAD // 2
+        for item in range(start, start + ITEMS_PER_THREAD):
+            add(item)
+
+    return work
+
+
+def main() -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>7} {'global lock':>14} {'seen set':>14} {'grouper':>14}  (Mops/s)")
+    for threads in THREAD_COUNTS:
+        total = threads * ITEMS_PER_THREAD / 1_000_000
+        global_lock = _timed(threads, _add_all(_GlobalLockSet()))
+        striped = _timed(threads, _add_all(ConcurrentSeenSet()))
+        grouper = _timed(threads, _add_all(ConcurrentGrouper(lambda x: x % 1024)))
+        print(
+            f"{threads:>7} {total / global_lock:>14.2f} {total / striped:>14.2f} "
+            f"{total / grouper:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Tests for the persistent cache."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from functools import partial
+from unittest import mock
+
+from usefull.cache import CacheStats, PersistentCache
+from usefull.text import remove_duplicates, slugify, word_count
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "cache.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_map_matches_function(self):
+        texts = ["Hello World", "Café", "Hello World", ""]
+        with PersistentCache(self.path) as cache:
+            self.assertEqual(cache.map(slugify, texts), [slugify(t) for t in texts])
+            self.assertEqual(cache.stats, CacheStats(hits=1, misses=3))
+
+    def test_persists_between_runs(self):
+        texts = ["a b a", "c c"]
+        with PersistentCache(self.path) as cache:
+            cache.map(remove_duplicates, texts)
+        with PersistentCache(self.path) as cache:
+            self.assertEqual(cache.map(remove_duplicates, texts), ["a b", "c"])
+            self.assertEqual(cache.stats, CacheStats(hits=2, misses=0))
+            self.assertEqual(cache.stats.hit_rate, 1.0)
+
+    def test_arguments_are_part_of_key(self):
+        with PersistentCache(self.path) as cache:
+            self.assertEqual(cache.map(slugify, ["a b"]), ["a-b"])
+            self.assertEqual(cache.map(slugify, ["a b"], separator="_"), ["a_b"])
+            self.assertEqual(cache.map(word_count, ["a b"]), [2])
+            self.assertEqual(cache.stats.misses, 3)
+
+    def test_version_is_part_of_key(self):
+        with PersistentCache(self.path) as cache:
+            cache.map(slugify, ["a b"])
+        with mock.patch("usefull.cache.__version__", "0.0.0"):
+            with PersistentCache(self.path) as cache:
+                cache.map(slugify, ["a b"])
+                self.assertEqual(cache.stats.misses, 1)
+
+    def test_lru_eviction(self):
+        with PersistentCache(self.path, max_entries=2, batch_size=1) as cache:
+            cache.map(slugify, ["a", "b"])
+            cache.map(slugify, ["a"])  # refresh "a"
+            cache.map(slugify, ["c"])  # evicts "b"
+            self.assertEqual(len(cache), 2)
+            cache.reset_stats()
+            cache.map(slugify, ["a", "c", "b"])
+            self.assertEqual(cache.stats, CacheStats(hits=2, misses=1))
+
+    def test_size_tracked_through_evictions(self):
+        texts = [f"item {i}" for i in range(50)]
+        with PersistentCache(self.path, max_entries=7, batch_size=3) as cache:
+            cache.map(slugify, texts)
+            self.assertEqual(len(cache), 7)
+        with PersistentCache(self.path) as cache:
+            self.assertEqual(len(cache), 7)
+
+    def test_recent_hits_are_not_rewritten(self):
+        with PersistentCache(self.path, max_entries=1000, batch_size=10) as cache:
+            cache.map(slugify, ["a", "b"])
+            changes = cache._connection.total_changes
+            cache.map(slugify, ["a", "b"])
+            self.assertEqual(cache._connection.total_changes, changes)
+            self.assertEqual(cache.stats, CacheStats(hits=2, misses=2))
+
+    def test_wrap(self):
+        with PersistentCache(self.path) as cache:
+            cached = cache.wrap(slugify)
+            self.assertEqual(cached("Hello World"), "hello-world")
+            self.assertEqual(cached("Hello World"), "hello-world")
+            self.assertEqual(cached.__name__, "slugify")
+            self.assertEqual(cache.stats, CacheStats(hits=1, misses=1))
+
+    def test_batches_larger_than_parameter_limit(self):
+        texts = [f"item {i}" for i in range(1200)]
+        with PersistentCache(self.path, batch_size=2000) as cache:
+            cache.map(slugify, texts)
+            self.assertEqual(cache.map(slugify, texts)[-1], "item-1199")
+            self.assertEqual(cache.stats, CacheStats(hits=1200, misses=1200))
+
+    def test_clear(self):
+        with PersistentCache(self.path) as cache:
+            cache.map(slugify, ["a"])
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+
+    def test_lambdas_rejected(self):
+        with PersistentCache(self.path) as cache:
+            with self.assertRaises(TypeError):
+                cache.map(lambda s: s.upper(), ["ab"])
+            with self.assertRaises(TypeError):
+                cache.map(lambda s: s.lower() + "!", ["ab"])
+            self.assertEqual(len(cache), 0)
+
+    def test_closures_rejected(self):
+        def make(suffix):
+            def add_suffix(text):
+                return text + suffix
+
+            return add_suffix
+
+        with PersistentCache(self.path) as cache:
+            with self.assertRaises(TypeError):
+                cache.map(make("!"), ["ab"])
+
+    def test_partial_rejected(self):
+        with PersistentCache(self.path) as cache:
+            with self.assertRaises(TypeError):
+                cache.map(partial(slugify, separator="_"), ["a b"])
+            with self.assertRaises(TypeError):
+                cache.wrap(partial(slugify, separator="_"))
+
+    def test_bound_method_rejected(self):
+        with PersistentCache(self.path) as cache:
+            with self.assertRaises(TypeError):
+                cache.map("x{}".format, ["a"])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            PersistentCache(self.path, max_entries=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
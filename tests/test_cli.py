@@ -0,0 +1,108 @@
+"""Tests for the command-line interface."""
+
+import io
+import unittest
+
+from usefull.cli import _IN_FLIGHT_PER_WORKER, _map_batches, main
+
+INPUT = "Hello World\nCafé au lait\nuser@example.com\nHello World\nbad\n".encode()
+
+
+def run(*argv, data=INPUT):
+    stdout = io.BytesIO()
+    stderr = io.BytesIO()
+    code = main(list(argv), io.BytesIO(data), stdout, stderr)
+    return code, stdout.getvalue().decode(), stderr.getvalue().decode()
+
+
+class TestSlugify(unittest.TestCase):
+    def test_lines(self):
+        code, out, _ = run("slugify", "-q")
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            out.splitlines(),
+            ["hello-world", "cafe-au-lait", "user-example-com", "hello-world", "bad"],
+        )
+
+    def test_column(self):
+        _, out, _ = run("slugify", "-q", "--column", "1", data=b"a,Hello There,x\nb\n")
+        self.assertEqual(out, "a,hello-there,x\nb\n")
+
+    def test_workers_keep_order(self):
+        data = "".join(f"Line {i}\n" for i in range(50)).encode()
+        _, out, _ = run("slugify", "-q", "--workers", "2", "--batch-size", "3", data=data)
+        self.assertEqual(out.splitlines(), [f"line-{i}" for i in range(50)])
+
+
+class TestMapBatches(unittest.TestCase):
+    def test_in_flight_is_bounded(self):
+        workers = 2
+        read = 0
+
+        def batches():
+            nonlocal read
+            for i in range(20):
+                read += 1
+                yield [b"x"] * i
+
+        results = []
+        for result in _map_batches(len, batches(), workers):
+            # The batch just read may be waiting for a free slot
+            self.assertLessEqual(
+                read - len(results), _IN_FLIGHT_PER_WORKER * workers + 1
+            )
+            results.append(result)
+        self.assertEqual(results, list(range(20)))
+
+
+class TestValidate(unittest.TestCase):
+    def test_email(self):
+        _, out, _ = run("validate", "-q")
+        self.assertEqual(out, "user@example.com\n")
+
+    def test_invert(self):
+        _, out, _ = run("validate", "-q", "--invert")
+        self.assertNotIn("user@example.com", out)
+        self.assertEqual(len(out.splitlines()), 4)
+
+    def test_url(self):
+        _, out, _ = run("validate", "-q", "--kind", "url", data=b"https://a.io\nnope\r\n")
+        self.assertEqual(out, "https://a.io\n")
+
+
+class TestOtherCommands(unittest.TestCase):
+    def test_dedup(self):
+        _, out, _ = run("dedup", "-q")
+        self.assertEqual(out.count("Hello World"), 1)
+        self.assertEqual(len(out.splitlines()), 4)
+
+    def test_wordcount(self):
+        _, out, _ = run("wordcount", "-q", "--batch-size", "2")
+        self.assertEqual(out, "9\n")
+
+    def test_chunk(self):
+        _, out, _ = run("chunk", "-q", "--size", "2", "--separator", "|", data=b"a\nb\nc\n")
+        self.assertEqual(out, "a|b\nc\n")
+
+    def test_chunk_invalid_overlap(self):
+        with self.assertRaises(SystemExit):
+            run("chunk", "--size", "2", "--overlap", "2")
+
+    def test_binary_passthrough(self):
+        stdout = io.BytesIO()
+        main(["slugify", "-q", "--column", "1"], io.BytesIO(b"\xff,A B\n"), stdout)
+        self.assertEqual(stdout.getvalue(), b"\xff,a-b\n")
+
+
+class TestStats(unittest.TestCase):
+    def test_report(self):
+        _, _, err = run("dedup")
+        self.assertIn("usefull dedup: 5 lines", err)
+
+    def test_quiet(self):
+        _, _, err = run("dedup", "-q")
+        self.assertEqual(err, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,21 @@
 """Tests for collection utilities."""
 
+import array
+import math
+import random
 import unittest
-from usefull.collections import flatten, chunk, unique, group_by
+from fractions import Fraction
+from usefull.collections import (
+    flatten,
+    chunk,
+    window,
+    window_sum,
+    window_mean,
+    window_min,
+    window_max,
+    unique,
+    group_by,
+)
 
 
 class TestFlatten(unittest.TestCase):
@@ -38,6 +52,119 @@ class TestChunk(unittest.TestCase):
         with self.assertRaises(ValueError):
             list(chunk([1, 2], 0))
 
+    def test_streams_input(self):
+        chunks = chunk(iter(range(10**9)), 3)
+        self.assertEqual(next(chunks), [0, 1, 2])
+
+    def test_overlap(self):
+        self.assertEqual(
+            list(chunk([1, 2, 3, 4, 5, 6], 3, overlap=1)),
+            [[1, 2, 3], [3, 4, 5], [5, 6]],
+        )
+
+    def test_overlap_exact(self):
+        self.assertEqual(
+            list(chunk([1, 2, 3, 4, 5], 3, overlap=1)), [[1, 2, 3], [3, 4, 5]]
+        )
+
+    def test_overlap_short_input(self):
+        self.assertEqual(list(chunk([1, 2], 3, overlap=2)), [[1, 2]])
+
+    def test_invalid_overlap(self):
+        with self.assertRaises(ValueError):
+            list(chunk([1, 2], 2, overlap=2))
+
+
+class TestWindow(unittest.TestCase):
+    def test_basic(self):
+        self.assertEqual(list(window([1, 2, 3, 4], 2)), [[1, 2], [2, 3], [3, 4]])
+
+    def test_step(self):
+        self.assertEqual(list(window(range(7), 3, step=2)), [[0, 1, 2], [2, 3, 4], [4, 5, 6]])
+
+    def test_step_larger_than_size(self):
+        self.assertEqual(list(window(range(8), 2, step=3)), [[0, 1], [3, 4], [6, 7]])
+
+    def test_too_short(self):
+        self.assertEqual(list(window([1, 2], 3)), [])
+
+    def test_view(self):
+        data = array.array("i", [1, 2, 3, 4])
+        views = list(window(data, 3, view=True))
+        self.assertEqual([v.tolist() for v in views], [[1, 2, 3], [2, 3, 4]])
+        data[1] = 20
+        self.assertEqual(views[0].tolist(), [1, 20, 3])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            list(window([1], 0))
+        with self.assertRaises(ValueError):
+            list(window([1], 1, step=0))
+
+
+class TestWindowReductions(unittest.TestCase):
+    data = [4, 2, 3, 1, 5, 5, 0]
+
+    def naive(self, func, size):
+        return [func(self.data[i : i + size]) for i in range(len(self.data) - size + 1)]
+
+    def test_sum(self):
+        self.assertEqual(list(window_sum(self.data, 3)), self.naive(sum, 3))
+
+    def test_mean(self):
+        self.assertEqual(list(window_mean([1, 2, 3, 4, 5], 2)), [1.5, 2.5, 3.5, 4.5])
+
+    def test_min(self):
+        for size in range(1, 5):
+            self.assertEqual(list(window_min(self.data, size)), self.naive(min, size))
+
+    def test_max(self):
+        for size in range(1, 5):
+            self.assertEqual(list(window_max(self.data, size)), self.naive(max, size))
+
+    def test_too_short(self):
+        self.assertEqual(list(window_sum([1], 2)), [])
+
+    def naive_fsum(self, data, size):
+        return [math.fsum(data[i : i + size]) for i in range(len(data) - size + 1)]
+
+    def test_sum_mixed_magnitudes(self):
+        data = [1e16, 1.0, 1.0, 1.0, 1.0, -1e16, 1e-8, 3.0]
+        self.assertEqual(list(window_sum(data, 2)), self.naive_fsum(data, 2))
+        self.assertEqual(list(window_sum(data, 3)), self.naive_fsum(data, 3))
+
+    def test_sum_random_floats(self):
+        rng = random.Random(0)
+        data = [rng.uniform(-1, 1) * 10 ** rng.randint(-10, 16) for _ in range(500)]
+        for size in (1, 2, 7, 50):
+            self.assertEqual(list(window_sum(data, size)), self.naive_fsum(data, size))
+
+    def test_sum_non_finite(self):
+        inf, nan = math.inf, math.nan
+        self.assertEqual(list(window_sum([inf, 1.0, 2.0, 3.0], 2)), [inf, 3.0, 5.0])
+        self.assertEqual(list(window_sum([-inf, 1.0, 2.0], 2)), [-inf, 3.0])
+        result = list(window_sum([1.0, nan, 2.0, 3.0], 2))
+        self.assertTrue(math.isnan(result[0]) and math.isnan(result[1]))
+        self.assertEqual(result[2], 5.0)
+        result = list(window_sum([inf, -inf, 1.0, 2.0], 2))
+        self.assertTrue(math.isnan(result[0]))
+        self.assertEqual(result[1:], [-inf, 3.0])
+
+    def test_sum_overflow(self):
+        data = [1e308, 1e308, -1e308, 1.0, 2.0]
+        self.assertEqual(list(window_sum(data, 2)), [math.inf, 0.0, -1e308 + 1.0, 3.0])
+        self.assertEqual(list(window_sum(data, 3)), [1e308, 1.0, -1e308])
+        self.assertEqual(
+            list(window_sum([-1e308, -1e308, 5.0, 5.0], 2)), [-math.inf, -1e308, 10.0]
+        )
+
+    def test_sum_mixed_int_float(self):
+        self.assertEqual(list(window_sum([1, 0.5, 2, 3], 2)), [1.5, 2.5, 5])
+
+    def test_mean_floats(self):
+        data = [1e16, 1.0, 1.0, 3.0]
+        self.assertEqual(list(window_mean(data, 2)), [5e15, 1.0, 2.0])
+
 
 class TestUnique(unittest.TestCase):
     def test_basic(self):
@@ -52,6 +179,51 @@ class TestUnique(unittest.TestCase):
     def test_no_duplicates(self):
         self.assertEqual(unique([1, 2, 3]), [1, 2, 3])
 
+    def test_key(self):
+        self.assertEqual(unique(["a", "B", "b", "A"], key=str.lower), ["a", "B"])
+
+    def test_dicts_ignore_key_order(self):
+        records = [{"a": 1, "b": [1, 2]}, {"b": [1, 2], "a": 1}, {"a": 1, "b": [2, 1]}]
+        self.assertEqual(unique(records), [records[0], records[2]])
+
+    def test_nested_and_shared(self):
+        shared = {"tags": ["x", "y"]}
+        records = [{"id": 1, "meta": shared}, {"id": 1, "meta": shared}, {"id": 2, "meta": shared}]
+        self.assertEqual(unique(records), [records[0], records[2]])
+
+    def test_follows_equality(self):
+        self.assertEqual(
+            unique([[1], [1.0], [True], ["1"], [b"1"], (1,)]), [[1], ["1"], [b"1"], (1,)]
+        )
+        self.assertEqual(unique([{"a": 0.0}, {"a": -0.0}]), [{"a": 0.0}])
+        self.assertEqual(unique([[0.5], [Fraction(1, 2)], [0.25]]), [[0.5], [0.25]])
+        self.assertEqual(unique([[10**30], [float(10**30)]]), [[10**30], [float(10**30)]])
+
+    def test_str_subclass(self):
+        class Tag(str):
+            pass
+
+        self.assertEqual(unique([["a"], [Tag("a")]]), [["a"]])
+
+    def test_leaf_encodings_do_not_collide(self):
+        self.assertEqual(
+            unique([["lice:slice(1, 2, None)"], [slice(1, 2)]]),
+            [["lice:slice(1, 2, None)"], [slice(1, 2)]],
+        )
+        pieces = [["ab", "c"], ["a", "bc"], [b"ab"]]
+        self.assertEqual(unique(pieces), pieces)
+        self.assertEqual(unique([{"a": ["b"]}, {"a": "b"}]), [{"a": ["b"]}, {"a": "b"}])
+
+    def test_sets_in_records(self):
+        self.assertEqual(unique([[{1, 2}], [{2, 1}]]), [[{1, 2}]])
+
+    def test_mixed_hashable_and_unhashable(self):
+        self.assertEqual(unique([1, [1], 1, [1]]), [1, [1]])
+
+    def test_canonical_disabled(self):
+        with self.assertRaises(TypeError):
+            unique([[1], [1]], canonical=False)
+
 
 class TestGroupBy(unittest.TestCase):
     def test_modulo(self):
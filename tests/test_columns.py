@@ -0,0 +1,121 @@
+"""Tests for columnar batch utilities."""
+
+import math
+import unittest
+from array import array
+
+from usefull.columns import Column, apply, as_column
+from usefull.numeric import clamp, percentage, round_to
+from usefull.text import slugify, truncate, word_count
+from usefull.validation import is_email, is_empty, is_url
+
+
+class TestAsColumn(unittest.TestCase):
+    def test_list_without_nulls(self):
+        column = as_column(["a", "b"])
+        self.assertIsNone(column.validity)
+        self.assertEqual(column.to_list(), ["a", "b"])
+
+    def test_list_with_nulls(self):
+        column = as_column(["a", None, "c"])
+        self.assertEqual(column.null_count, 1)
+        self.assertFalse(column.is_valid(1))
+        self.assertEqual(column.to_list(), ["a", None, "c"])
+
+    def test_array_is_not_copied(self):
+        data = array("d", [1.0, 2.0])
+        self.assertIs(as_column(data).values, data)
+
+    def test_buffer_with_validity(self):
+        column = as_column(array("q", [1, 2, 3]), validity=b"\x05")
+        self.assertEqual(column.to_list(), [1, None, 3])
+
+    def test_short_validity(self):
+        with self.assertRaises(ValueError):
+            as_column(array("q", range(9)), validity=b"\xff")
+
+    def test_generator(self):
+        self.assertEqual(as_column(x for x in [1, None]).to_list(), [1, None])
+
+    def test_pylist_protocol(self):
+        class ArrowLike:
+            def to_pylist(self):
+                return ["x", None]
+
+        self.assertEqual(as_column(ArrowLike()).null_count, 1)
+
+
+class TestApply(unittest.TestCase):
+    texts = ["Hello World!", "Café au lait", "", "  spaced  out  "]
+    emails = ["user@example.com", "invalid", "a.b+c@d.co.uk"]
+
+    def test_matches_per_row(self):
+        cases = [
+            (slugify, self.texts, ()),
+            (slugify, self.texts, ("_",)),
+            (slugify, ["line\nbreak", "Ünïcode ﬁ ½", "x"], ()),
+            (slugify, self.texts, ("\n",)),
+            (truncate, self.texts, (6,)),
+            (word_count, self.texts, ()),
+            (is_email, self.emails, ()),
+            (is_url, ["https://example.com", "nope"], ()),
+            (is_empty, [None, "", "x", [], 0], ()),
+            (clamp, [-5, 5, 15, math.nan, math.inf], (0, 10)),
+            (clamp, [-5.5, math.nan], (0.0, 10.0)),
+            (round_to, [7, 8, 3.14159], (5,)),
+            (percentage, [1, 25, 50], (200,)),
+        ]
+        for func, values, args in cases:
+            with self.subTest(func=func.__name__, args=args):
+                expected = [func(value, *args) for value in values]
+                self.assertEqual(list(apply(func, values, *args)), expected)
+
+    def test_typed_output(self):
+        self.assertEqual(apply(is_email, self.emails).values, array("b", [1, 0, 1]))
+        self.assertEqual(apply(word_count, ["a b", ""]).values, array("q", [2, 0]))
+        self.assertIsInstance(apply(slugify, self.texts).values, list)
+
+    def test_same_typecode(self):
+        result = apply(clamp, array("i", [-5, 5, 15]), 0, 10)
+        self.assertEqual(result.values, array("i", [0, 5, 10]))
+
+    def test_same_typecode_fallback(self):
+        result = apply(clamp, array("i", [-5, 5]), 0.5, 10)
+        self.assertEqual(result.values, [0.5, 5])
+
+    def test_nulls_propagate(self):
+        result = apply(slugify, ["Hello World", None, "Foo"])
+        self.assertEqual(result.to_list(), ["hello-world", None, "foo"])
+        result = apply(is_email, [None, "user@example.com"])
+        self.assertEqual(result.to_list(), [None, 1])
+
+    def test_null_runs(self):
+        values = [str(i) if i % 7 and i < 19 else None for i in range(21)]
+        column = as_column(values)
+        self.assertEqual(column.to_list(), values)
+        self.assertEqual(len(column.validity), 3)
+        expected = [None if value is None else word_count(value) for value in values]
+        self.assertEqual(apply(word_count, values).to_list(), expected)
+
+    def test_is_empty_nulls_are_empty(self):
+        result = apply(is_empty, [None, "", "x"])
+        self.assertIsNone(result.validity)
+        self.assertEqual(result.to_list(), [True, True, False])
+        result = apply(is_empty, as_column(array("q", [1, 2]), validity=b"\x01"))
+        self.assertEqual(result.to_list(), [False, True])
+
+    def test_kernel_errors(self):
+        with self.assertRaises(ValueError):
+            apply(clamp, [1], 10, 0)
+
+    def test_unregistered_function(self):
+        result = apply(str.upper, ["a", None])
+        self.assertEqual(result.to_list(), ["A", None])
+
+    def test_column_input(self):
+        column = Column(["x y"], None)
+        self.assertEqual(apply(word_count, column).to_list(), [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
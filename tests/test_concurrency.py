@@ -0,0 +1,94 @@
+"""Tests for thread-safe accumulators."""
+
+import threading
+import unittest
+
+from usefull.collections import group_by
+from usefull.concurrency import ConcurrentGrouper, ConcurrentSeenSet
+
+THREADS = 8
+
+
+def run_threads(target, count=THREADS):
+    barrier = threading.Barrier(count)
+
+    def worker(index):
+        barrier.wait()
+        target(index)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestConcurrentSeenSet(unittest.TestCase):
+    def test_add(self):
+        seen = ConcurrentSeenSet()
+        self.assertTrue(seen.add("a"))
+        self.assertFalse(seen.add("a"))
+        self.assertIn("a", seen)
+        self.assertNotIn("b", seen)
+
+    def test_discard_and_clear(self):
+        seen = ConcurrentSeenSet(shards=2)
+        seen.add(1)
+        seen.add(2)
+        seen.discard(1)
+        seen.discard(3)
+        self.assertEqual(len(seen), 1)
+        seen.clear()
+        self.assertEqual(len(seen), 0)
+
+    def test_filter_new(self):
+        seen = ConcurrentSeenSet()
+        self.assertEqual(list(seen.filter_new([3, 1, 3, 2, 1])), [3, 1, 2])
+
+    def test_invalid_shards(self):
+        with self.assertRaises(ValueError):
+            ConcurrentSeenSet(shards=0)
+
+    def test_exactly_one_winner_per_item(self):
+        seen = ConcurrentSeenSet(shards=4)
+        wins = [[] for _ in range(THREADS)]
+        items = list(range(20000))
+
+        run_threads(lambda index: wins[index].extend(seen.filter_new(items)))
+
+        winners = [item for batch in wins for item in batch]
+        self.assertEqual(sorted(winners), items)
+        self.assertEqual(len(seen), len(items))
+
+
+class TestConcurrentGrouper(unittest.TestCase):
+    def test_matches_group_by(self):
+        grouper = ConcurrentGrouper(len)
+        words = ["hi", "hello", "hey", "yo"]
+        grouper.extend(words)
+        self.assertEqual(grouper.groups(), group_by(words, len))
+        self.assertEqual(len(grouper), 3)
+
+    def test_groups_is_snapshot(self):
+        grouper = ConcurrentGrouper(lambda x: x)
+        grouper.add(1)
+        snapshot = grouper.groups()
+        grouper.add(1)
+        self.assertEqual(snapshot, {1: [1]})
+
+    def test_concurrent_extend(self):
+        grouper = ConcurrentGrouper(lambda x: x % 10, shards=4)
+        per_thread = 5000
+
+        run_threads(
+            lambda index: grouper.extend(range(index * per_thread, (index + 1) * per_thread))
+        )
+
+        groups = grouper.groups()
+        self.assertEqual(set(groups), set(range(10)))
+        for k, group in groups.items():
+            self.assertEqual(sorted(group), list(range(k, THREADS * per_thread, 10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 """Tests for validation utilities."""
 
 import unittest
-from usefull.validation import is_email, is_url, is_empty
+from usefull.validation import is_email, is_url, is_empty, is_empty_deep, count_empty
 
 
 class TestIsEmail(unittest.TestCase):
@@ -75,6 +75,110 @@ class TestIsEmpty(unittest.TestCase):
     def test_non_empty_list(self):
         self.assertFalse(is_empty([1, 2, 3]))
 
+    def test_bytes_and_range(self):
+        self.assertTrue(is_empty(b""))
+        self.assertTrue(is_empty(range(0)))
+        self.assertFalse(is_empty(b"x"))
+
+    def test_mixed_whitespace(self):
+        self.assertTrue(is_empty(" \t\n"))
+        self.assertFalse(is_empty(" a "))
+
+    def test_custom_container(self):
+        class Box:
+            def __init__(self, items):
+                self.items = items
+
+            def __len__(self):
+                return len(self.items)
+
+        self.assertTrue(is_empty(Box([])))
+        self.assertFalse(is_empty(Box([1])))
+
+    def test_array_like(self):
+        class Array:
+            shape = (3, 0)
+            size = 0
+
+            def __len__(self):
+                return 3
+
+        self.assertTrue(is_empty(Array()))
+
+    def test_iterator_not_consumed(self):
+        gen = (x for x in [1, 2])
+        self.assertFalse(is_empty(gen))
+        self.assertEqual(list(gen), [1, 2])
+        self.assertTrue(is_empty(iter([])))
+
+    def test_register(self):
+        class Sentinel:
+            pass
+
+        self.assertFalse(is_empty(Sentinel()))
+        is_empty.register(Sentinel, lambda value: True)
+        self.assertTrue(is_empty(Sentinel()))
+
+    def test_register_decorator_and_subclass(self):
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        self.assertFalse(is_empty(Child()))
+
+        @is_empty.register(Base)
+        def _(value):
+            return True
+
+        self.assertTrue(is_empty(Child()))
+
+    def test_register_builtin_fast_path_rejected(self):
+        with self.assertRaises(ValueError):
+            is_empty.register(str, lambda value: False)
+
+
+class TestIsEmptyDeep(unittest.TestCase):
+    def test_nested_empty(self):
+        self.assertTrue(is_empty_deep({"a": None, "b": ["", {}]}))
+
+    def test_nested_non_empty(self):
+        self.assertFalse(is_empty_deep([[], [[0]]]))
+
+    def test_self_reference(self):
+        empty = []
+        empty.append(empty)
+        self.assertTrue(is_empty_deep(empty))
+        record = {"a": None}
+        record["self"] = record
+        self.assertTrue(is_empty_deep(record))
+        record["b"] = 1
+        self.assertFalse(is_empty_deep(record))
+
+    def test_shared_child_not_treated_as_cycle(self):
+        child = [0]
+        self.assertFalse(is_empty_deep([child, child]))
+        empty = []
+        self.assertTrue(is_empty_deep([empty, empty]))
+
+    def test_scalar(self):
+        self.assertTrue(is_empty_deep("  "))
+        self.assertFalse(is_empty_deep(1))
+
+
+class TestCountEmpty(unittest.TestCase):
+    def test_basic(self):
+        records = [{"a": "", "b": 1}, {"a": "x"}, {"a": None, "b": []}]
+        self.assertEqual(count_empty(records, ["a", "b"]), {"a": 2, "b": 2})
+
+    def test_generator_spanning_blocks(self):
+        records = ({"a": "" if i % 3 else "x"} for i in range(10000))
+        self.assertEqual(count_empty(records, ["a"]), {"a": 6666})
+
+    def test_no_records(self):
+        self.assertEqual(count_empty([], ["a"]), {"a": 0})
+
 
 if __name__ == "__main__":
     unittest.main()
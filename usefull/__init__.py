@@ -13,6 +13,11 @@ from usefull.text import (
 from usefull.collections import (
     flatten,
     chunk,
+    window,
+    window_sum,
+    window_mean,
+    window_min,
+    window_max,
     unique,
     group_by,
 )
@@ -20,6 +25,8 @@ from usefull.validation import (
     is_email,
     is_url,
     is_empty,
+    is_empty_deep,
+    count_empty,
 )
 from usefull.numeric import (
     clamp,
@@ -38,12 +45,19 @@ __all__ = [
     # Collection utilities
     "flatten",
     "chunk",
+    "window",
+    "window_sum",
+    "window_mean",
+    "window_min",
+    "window_max",
     "unique",
     "group_by",
     # Validation utilities
     "is_email",
     "is_url",
     "is_empty",
+    "is_empty_deep",
+    "count_empty",
     # Numeric utilities
     "clamp",
     "lerp",
@@ -0,0 +1,7 @@
+"""Allow running the command-line interface with ``python -m usefull``."""
+
+import sys
+
+from usefull.cli import main
+
+sys.exit(main())
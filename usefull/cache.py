@@ -0,0 +1,283 @@
+"""Persistent memoization for expensive transforms.
+
+An opt-in, ``sqlite3``-backed cache that survives between runs, so nightly
+jobs that re-slugify largely the same data only compute what is new::
+
+    with PersistentCache("slugs.db") as cache:
+        slugs = cache.map(slugify, titles)
+        print(cache.stats)
+
+Entries are keyed by a digest of the function, its arguments and the library
+version, so upgrading ``usefull`` never serves stale results. Lookups and
+writes are batched per chunk of inputs, and the least recently used entries
+are evicted once the cache grows past ``max_entries``. To keep warm reruns
+cheap, a hit only rewrites its entry's timestamp once that timestamp is more
+than a quarter of the cache's capacity old, so LRU order is approximate.
+
+Cached functions must return JSON-serializable values (all ``usefull.text``
+functions do) and take arguments with a stable ``repr``. They must also be
+importable by name: lambdas, nested functions, ``functools.partial`` objects
+and bound methods carry state that is not part of the key and are rejected.
+"""
+
+import json
+import sqlite3
+from functools import wraps
+from hashlib import blake2b
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Tuple,
+)
+
+from usefull import __version__
+from usefull.collections import chunk
+
+# Stay below SQLite's default limit on bound parameters per statement
+_MAX_VARIABLES = 500
+# Hits are re-stamped only once their last use is more than 1/_REFRESH_FRACTION
+# of the cache's capacity (counted in batches) old
+_REFRESH_FRACTION = 4
+# Evictions between exact recounts of the table; in between, the size is
+# tracked from inserted and deleted row counts
+_RECOUNT_INTERVAL = 100
+
+
+def _function_name(func: Callable[..., Any]) -> str:
+    """Return the import path identifying 'func', or raise TypeError."""
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    owner = getattr(func, "__self__", None)
+    if (
+        module is None
+        or qualname is None
+        or "<" in qualname  # <lambda> and <locals>
+        or (owner is not None and not isinstance(owner, ModuleType))
+    ):
+        raise TypeError(
+            f"cannot cache {func!r}: only module-level functions have a stable "
+            "identity; define the function at module level and pass extra "
+            "arguments through map()"
+        )
+    return f"{module}.{qualname}"
+
+
+class CacheStats(NamedTuple):
+    """Hit and miss counters of a PersistentCache."""
+
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class PersistentCache:
+    """
+    An on-disk LRU cache for function results.
+
+    Args:
+        path: Path of the SQLite database file (":memory:" for a temporary cache).
+        max_entries: Maximum number of cached results (default: 1,000,000).
+        batch_size: Number of inputs looked up and stored per round trip
+            (default: 1000).
+
+    Examples:
+        >>> from usefull.text import slugify
+        >>> with PersistentCache(":memory:") as cache:
+        ...     cache.map(slugify, ["Hello World", "Hello World"])
+        ...     cache.stats
+        ['hello-world', 'hello-world']
+        CacheStats(hits=1, misses=1)
+    """
+
+    def __init__(
+        self, path: str, max_entries: int = 1_000_000, batch_size: int = 1000
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.max_entries = max_entries
+        self.batch_size = batch_size
+        self._refresh_age = max_entries // (_REFRESH_FRACTION * batch_size)
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key BLOB PRIMARY KEY,
+                value TEXT NOT NULL,
+                last_used INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+            """
+        )
+        self._clock, self._size = self._connection.execute(
+            "SELECT COALESCE(MAX(last_used), 0), COUNT(*) FROM entries"
+        ).fetchone()
+        self._evictions = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __enter__(self) -> "PersistentCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hits and misses since the cache was opened or last reset."""
+        return CacheStats(self._hits, self._misses)
+
+    def reset_stats(self) -> None:
+        """Reset the hit and miss counters."""
+        self._hits = 0
+        self._misses = 0
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._connection:
+            self._connection.execute("DELETE FROM entries")
+        self._size = 0
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        self._connection.close()
+
+    def map(
+        self, func: Callable[..., Any], values: Iterable[Any], *args: Any, **kwargs: Any
+    ) -> List[Any]:
+        """
+        Apply 'func' to every value, reusing cached results.
+
+        Each value is passed as the first argument, followed by 'args' and
+        'kwargs'. Values are processed in chunks of 'batch_size', with one
+        batched read and one batched write per chunk.
+
+        Args:
+            func: The function to apply.
+            values: The values to apply it to.
+            *args: Extra positional arguments for 'func'.
+            **kwargs: Extra keyword arguments for 'func'.
+
+        Returns:
+            The results, in the order of 'values'.
+
+        Raises:
+            TypeError: If 'func' is not a module-level function.
+        """
+        return list(self.imap(func, values, *args, **kwargs))
+
+    def imap(
+        self, func: Callable[..., Any], values: Iterable[Any], *args: Any, **kwargs: Any
+    ) -> Iterator[Any]:
+        """Lazy version of ``map`` that yields results one chunk at a time."""
+        signature = (__version__, _function_name(func), args, sorted(kwargs.items()))
+        prefix = blake2b(repr(signature).encode(), digest_size=16)
+        for batch in chunk(values, self.batch_size):
+            keys = []
+            for value in batch:
+                digest = prefix.copy()
+                digest.update(repr(value).encode())
+                keys.append(digest.digest())
+
+            found, stale = self._load(set(keys))
+            computed: Dict[bytes, Any] = {}
+            results = []
+            for value, key in zip(batch, keys):
+                if key in found:
+                    self._hits += 1
+                    results.append(found[key])
+                elif key in computed:
+                    self._hits += 1
+                    results.append(computed[key])
+                else:
+                    self._misses += 1
+                    result = func(value, *args, **kwargs)
+                    computed[key] = result
+                    results.append(result)
+            self._store(computed, stale)
+            yield from results
+
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Return a cached version of 'func' for single calls.
+
+        Every call is a database round trip; prefer ``map`` for bulk work.
+        """
+        _function_name(func)
+
+        @wraps(func)
+        def wrapper(value: Any, *args: Any, **kwargs: Any) -> Any:
+            return self.map(func, [value], *args, **kwargs)[0]
+
+        return wrapper
+
+    def _load(self, keys: Iterable[bytes]) -> Tuple[Dict[bytes, Any], List[bytes]]:
+        """Return the cached values of 'keys' and the found keys due a refresh."""
+        found: Dict[bytes, Any] = {}
+        stale = []
+        # The clock is advanced before the next store, so compare against that
+        oldest = self._clock + 1 - self._refresh_age
+        for group in chunk(keys, _MAX_VARIABLES):
+            placeholders = ",".join("?" * len(group))
+            rows = self._connection.execute(
+                "SELECT key, value, last_used FROM entries "
+                f"WHERE key IN ({placeholders})",
+                group,
+            ).fetchall()
+            if rows:
+                # One json.loads call for the whole group instead of one per row
+                group_keys, texts, stamps = zip(*rows)
+                found.update(zip(group_keys, json.loads(f"[{','.join(texts)}]")))
+                stale.extend(
+                    key for key, used in zip(group_keys, stamps) if used < oldest
+                )
+        return found, stale
+
+    def _store(self, computed: Dict[bytes, Any], touched: List[bytes]) -> None:
+        if not computed and not touched:
+            return
+        self._clock += 1
+        clock = self._clock
+        with self._connection:
+            for group in chunk(touched, _MAX_VARIABLES - 1):
+                placeholders = ",".join("?" * len(group))
+                self._connection.execute(
+                    f"UPDATE entries SET last_used = ? WHERE key IN ({placeholders})",
+                    (clock, *group),
+                )
+            self._size += self._connection.executemany(
+                "INSERT OR REPLACE INTO entries (key, value, last_used) VALUES (?, ?, ?)",
+                [(key, json.dumps(value), clock) for key, value in computed.items()],
+            ).rowcount
+            if self._size > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        self._evictions += 1
+        if self._evictions % _RECOUNT_INTERVAL == 0:
+            # Another process may share the database file
+            (self._size,) = self._connection.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()
+        excess = self._size - self.max_entries
+        if excess > 0:
+            self._size -= self._connection.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY last_used LIMIT ?)",
+                (excess,),
+            ).rowcount
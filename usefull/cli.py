@@ -0,0 +1,296 @@
+"""Command-line interface for streaming bulk processing.
+
+Every subcommand reads lines from stdin and writes results to stdout using
+buffered binary I/O, so arbitrarily large inputs are processed in constant
+memory. The exception is ``dedup``, which must remember every distinct line;
+it keeps a 16-byte digest per distinct line rather than the line itself.
+Per-line commands accept ``--workers N`` to spread batches over a process
+pool while keeping the output in input order. Throughput statistics are
+reported on stderr unless ``--quiet`` is given.
+
+Examples:
+    $ cut -d, -f2 products.csv | usefull slugify
+    $ usefull validate --kind email --workers 4 < emails.txt > valid.txt
+    $ usefull dedup < urls.txt | usefull wordcount
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from functools import partial
+from hashlib import blake2b
+from multiprocessing import Pool
+from multiprocessing.pool import AsyncResult
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+
+from usefull import __version__
+from usefull.collections import chunk
+from usefull.columns import apply
+from usefull.text import slugify, word_count
+from usefull.validation import is_email, is_url
+
+BATCH_SIZE = 10_000
+# Batches submitted to the pool but not yet written out, per worker
+_IN_FLIGHT_PER_WORKER = 2
+
+_ENCODING = "utf-8"
+# Undecodable bytes survive a decode/encode round trip unchanged
+_ERRORS = "surrogateescape"
+_VALIDATORS = {"email": is_email, "url": is_url}
+
+
+def _strip(line: bytes) -> bytes:
+    return line.rstrip(b"\r\n")
+
+
+def _decode(lines: Iterable[bytes]) -> List[str]:
+    return [_strip(line).decode(_ENCODING, _ERRORS) for line in lines]
+
+
+def _slugify_batch(
+    lines: List[bytes], separator: str, column: Optional[int], delimiter: str
+) -> List[bytes]:
+    texts = _decode(lines)
+    if column is None:
+        slugs = apply(slugify, texts, separator).values
+        return [slug.encode(_ENCODING) + b"\n" for slug in slugs]
+
+    rows = [text.split(delimiter) for text in texts]
+    cells = [row[column] if len(row) > column else "" for row in rows]
+    for row, slug in zip(rows, apply(slugify, cells, separator).values):
+        if len(row) > column:
+            row[column] = slug
+    return [delimiter.join(row).encode(_ENCODING, _ERRORS) + b"\n" for row in rows]
+
+
+def _validate_batch(lines: List[bytes], kind: str, invert: bool) -> List[bytes]:
+    flags = apply(_VALIDATORS[kind], _decode(lines)).values
+    return [
+        _strip(line) + b"\n" for line, flag in zip(lines, flags) if bool(flag) != invert
+    ]
+
+
+def _wordcount_batch(lines: List[bytes]) -> int:
+    return sum(apply(word_count, _decode(lines)).values)
+
+
+def _map_batches(
+    func: Callable[[List[bytes]], Any], batches: Iterable[List[bytes]], workers: int
+) -> Iterator[Any]:
+    """
+    Apply 'func' to every batch, in order, optionally in a process pool.
+
+    At most ``_IN_FLIGHT_PER_WORKER * workers`` batches are pending at once, so
+    input is read no faster than the workers and the consumer keep up with.
+    """
+    if workers <= 1:
+        yield from map(func, batches)
+        return
+    limit = _IN_FLIGHT_PER_WORKER * workers
+    with Pool(workers) as pool:
+        pending: Deque[AsyncResult] = deque()
+        for batch in batches:
+            if len(pending) >= limit:
+                yield pending.popleft().get()
+            pending.append(pool.apply_async(func, (batch,)))
+        while pending:
+            yield pending.popleft().get()
+
+
+class _Stats:
+    """Counts input lines and bytes as they are read."""
+
+    def __init__(self) -> None:
+        self.lines = 0
+        self.bytes = 0
+        self.start = time.perf_counter()
+
+    def count(self, batches: Iterable[List[bytes]]) -> Iterator[List[bytes]]:
+        for batch in batches:
+            self.lines += len(batch)
+            self.bytes += sum(map(len, batch))
+            yield batch
+
+    def report(self, command: str, stream: BinaryIO) -> None:
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        megabytes = self.bytes / 1_000_000
+        stream.write(
+            f"usefull {command}: {self.lines} lines, {megabytes:.1f} MB in "
+            f"{elapsed:.2f}s ({self.lines / elapsed:.0f} lines/s, "
+            f"{megabytes / elapsed:.1f} MB/s)\n".encode()
+        )
+        stream.flush()
+
+
+def _run(
+    args: argparse.Namespace, stdin: BinaryIO, stdout: BinaryIO, stats: _Stats
+) -> None:
+    batches = stats.count(chunk(stdin, args.batch_size))
+    command = args.command
+
+    if command == "slugify":
+        func = partial(
+            _slugify_batch,
+            separator=args.separator,
+            column=args.column,
+            delimiter=args.delimiter,
+        )
+        for output in _map_batches(func, batches, args.workers):
+            stdout.writelines(output)
+    elif command == "validate":
+        func = partial(_validate_batch, kind=args.kind, invert=args.invert)
+        for output in _map_batches(func, batches, args.workers):
+            stdout.writelines(output)
+    elif command == "wordcount":
+        total = sum(_map_batches(_wordcount_batch, batches, args.workers))
+        stdout.write(b"%d\n" % total)
+    elif command == "dedup":
+        seen = set()
+        for batch in batches:
+            for line in batch:
+                line = _strip(line)
+                digest = blake2b(line, digest_size=16).digest()
+                if digest not in seen:
+                    seen.add(digest)
+                    stdout.write(line + b"\n")
+    elif command == "chunk":
+        separator = args.separator.encode(_ENCODING)
+        lines = (_strip(line) for batch in batches for line in batch)
+        for group in chunk(lines, args.size, overlap=args.overlap):
+            stdout.write(separator.join(group) + b"\n")
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="usefull", description="Stream stdin through usefull utilities."
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "-q", "--quiet", action="store_true", help="do not report statistics on stderr"
+    )
+    common.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=BATCH_SIZE,
+        help=f"lines per batch (default: {BATCH_SIZE})",
+    )
+    parallel = argparse.ArgumentParser(add_help=False)
+    parallel.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="number of worker processes; output order is preserved (default: 1)",
+    )
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    slug = commands.add_parser(
+        "slugify", parents=[common, parallel], help="slugify each line"
+    )
+    slug.add_argument("--separator", default="-", help='word separator (default: "-")')
+    slug.add_argument(
+        "--column",
+        type=int,
+        help="only slugify this 0-based field; fields are split on --delimiter "
+        "without quote handling",
+    )
+    slug.add_argument("--delimiter", default=",", help='field delimiter (default: ",")')
+
+    validate = commands.add_parser(
+        "validate", parents=[common, parallel], help="keep only valid lines"
+    )
+    validate.add_argument("--kind", choices=sorted(_VALIDATORS), default="email")
+    validate.add_argument(
+        "--invert", action="store_true", help="keep only invalid lines instead"
+    )
+
+    commands.add_parser(
+        "wordcount", parents=[common, parallel], help="count words in the input"
+    )
+    commands.add_parser(
+        "dedup",
+        parents=[common],
+        help="drop repeated lines, keeping the first (memory grows with the "
+        "number of distinct lines, 16 bytes of digest each)",
+    )
+
+    group = commands.add_parser(
+        "chunk", parents=[common], help="join every SIZE lines into one line"
+    )
+    group.add_argument("--size", type=_positive_int, required=True)
+    group.add_argument(
+        "--overlap", type=int, default=0, help="lines shared by consecutive chunks"
+    )
+    group.add_argument("--separator", default=" ", help='join string (default: " ")')
+    return parser
+
+
+def main(
+    argv: Optional[Sequence[str]] = None,
+    stdin: Optional[BinaryIO] = None,
+    stdout: Optional[BinaryIO] = None,
+    stderr: Optional[BinaryIO] = None,
+) -> int:
+    """
+    Run the ``usefull`` command-line tool.
+
+    Args:
+        argv: Command-line arguments (default: ``sys.argv[1:]``).
+        stdin: Binary input stream (default: ``sys.stdin.buffer``).
+        stdout: Binary output stream (default: ``sys.stdout.buffer``).
+        stderr: Binary stream for statistics (default: ``sys.stderr.buffer``).
+
+    Returns:
+        The process exit code.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "chunk" and not 0 <= args.overlap < args.size:
+        parser.error("--overlap must be non-negative and smaller than --size")
+    if args.command == "slugify" and args.column is not None and args.column < 0:
+        parser.error("--column must be non-negative")
+
+    real_stdout = stdout is None
+    stdin = sys.stdin.buffer if stdin is None else stdin
+    stdout = sys.stdout.buffer if stdout is None else stdout
+    stderr = sys.stderr.buffer if stderr is None else stderr
+
+    stats = _Stats()
+    try:
+        _run(args, stdin, stdout, stats)
+        stdout.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); stop quietly and keep
+        # the interpreter from failing again when it flushes stdout at exit
+        if real_stdout:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    if not args.quiet:
+        stats.report(args.command, stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,26 @@
 """Collection manipulation utilities."""
 
-from typing import Any, Callable, Dict, Iterable, Iterator, List, TypeVar
+from collections import deque
+from collections.abc import Mapping
+from hashlib import blake2b
+from itertools import islice
+from math import inf, isfinite, isnan, nan
+from numbers import Number as _NumberABC
+from operator import gt, lt
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from usefull.numeric import Number
 
 T = TypeVar("T")
 K = TypeVar("K")
@@ -34,13 +54,18 @@ def flatten(nested: Iterable[Any], depth: int = -1) -> List[Any]:
     return result
 
 
-def chunk(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+def chunk(iterable: Iterable[T], size: int, overlap: int = 0) -> Iterator[List[T]]:
     """
     Split an iterable into chunks of specified size.
 
+    The iterable is consumed lazily, so only one chunk is held in memory.
+    With ``overlap`` each chunk starts with the last ``overlap`` items of the
+    previous one; the final chunk may be shorter but always contains new items.
+
     Args:
         iterable: The iterable to split.
         size: The size of each chunk.
+        overlap: Number of items shared by consecutive chunks (default: 0).
 
     Yields:
         Lists of items, each with at most 'size' elements.
@@ -50,23 +75,381 @@ def chunk(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
         [[1, 2], [3, 4], [5]]
         >>> list(chunk("abcdef", 3))
         [['a', 'b', 'c'], ['d', 'e', 'f']]
+        >>> list(chunk([1, 2, 3, 4, 5, 6], 3, overlap=1))
+        [[1, 2, 3], [3, 4, 5], [5, 6]]
         >>> list(chunk([], 5))
         []
     """
     if size <= 0:
         raise ValueError("Chunk size must be positive")
+    if not 0 <= overlap < size:
+        raise ValueError("overlap must be non-negative and smaller than size")
+
+    it = iter(iterable)
+    buffer = deque(islice(it, size), maxlen=size)
+    if not buffer:
+        return
+    yield list(buffer)
+    step = size - overlap
+    while len(buffer) == size:
+        new = list(islice(it, step))
+        if not new:
+            return
+        buffer.extend(new)
+        if len(new) == step:
+            yield list(buffer)
+        else:
+            yield list(buffer)[-(overlap + len(new)) :]
+            return
+
+
+def window(
+    iterable: Iterable[T], size: int, step: int = 1, view: bool = False
+) -> Iterator[Union[List[T], memoryview]]:
+    """
+    Slide a fixed-size window over an iterable.
+
+    Items are streamed through a bounded deque, so memory use is O(size)
+    regardless of the input length. Only full windows are produced.
+
+    With ``view=True`` the input must support the buffer protocol
+    (``array.array``, ``bytes``, ``memoryview``, ...) and each window is a
+    zero-copy ``memoryview`` slice of it.
+
+    Args:
+        iterable: The iterable to slide over.
+        size: The number of items in each window.
+        step: How many items the window advances each time (default: 1).
+        view: Yield memoryview slices instead of lists (default: False).
+
+    Yields:
+        Lists of exactly 'size' items, or memoryviews when 'view' is set.
+
+    Examples:
+        >>> list(window([1, 2, 3, 4], 2))
+        [[1, 2], [2, 3], [3, 4]]
+        >>> list(window("abcdefg", 3, step=2))
+        [['a', 'b', 'c'], ['c', 'd', 'e'], ['e', 'f', 'g']]
+        >>> [bytes(w) for w in window(b"abcd", 3, view=True)]
+        [b'abc', b'bcd']
+    """
+    if size <= 0:
+        raise ValueError("Window size must be positive")
+    if step <= 0:
+        raise ValueError("step must be positive")
+
+    if view:
+        buffer = memoryview(iterable)  # type: ignore[arg-type]
+        for start in range(0, len(buffer) - size + 1, step):
+            yield buffer[start : start + size]
+        return
+
+    it = iter(iterable)
+    items = deque(islice(it, size), maxlen=size)
+    if len(items) < size:
+        return
+    yield list(items)
+    while True:
+        new = list(islice(it, step))
+        if len(new) < step:
+            return
+        items.extend(new)
+        yield list(items)
+
+
+# Every finite float is an integer multiple of 2**-1074, so scaling by
+# 2**1074 turns float sums into exact integer arithmetic.
+_FLOAT_SCALE = 1 << 1074
+
+
+class _WindowTotal:
+    """
+    An exact running sum that supports removing previously added values.
+
+    Finite floats are accumulated as a scaled integer, so adding and later
+    subtracting a value never loses precision and intermediate sums cannot
+    overflow. Infinities and NaNs are counted separately instead of being
+    added, so they only affect the windows containing them. Other numbers
+    (ints, Fractions, Decimals) are accumulated as-is.
+    """
+
+    def __init__(self) -> None:
+        self.exact: Number = 0
+        self.scaled = 0
+        self.floats = 0
+        self.nans = 0
+        self.infs = 0
+        self.neg_infs = 0
+
+    def update(self, value: Number, sign: int) -> None:
+        if not isinstance(value, float):
+            self.exact += value if sign > 0 else -value
+            return
+        self.floats += sign
+        if isfinite(value):
+            numerator, denominator = value.as_integer_ratio()
+            scaled = numerator * (_FLOAT_SCALE // denominator)
+            self.scaled += scaled if sign > 0 else -scaled
+        elif isnan(value):
+            self.nans += sign
+        elif value > 0:
+            self.infs += sign
+        else:
+            self.neg_infs += sign
 
-    items = list(iterable)
-    for i in range(0, len(items), size):
-        yield items[i : i + size]
+    def value(self) -> Number:
+        if not self.floats:
+            return self.exact
+        if self.nans or (self.infs and self.neg_infs):
+            return nan
+        if self.infs:
+            return inf
+        if self.neg_infs:
+            return -inf
+        exact = self.exact
+        if isinstance(exact, int):
+            scaled = self.scaled + exact * _FLOAT_SCALE
+            try:
+                # int / int is correctly rounded, like math.fsum
+                return scaled / _FLOAT_SCALE
+            except OverflowError:
+                return inf if scaled > 0 else -inf
+        return float(exact) + self.scaled / _FLOAT_SCALE
 
 
-def unique(iterable: Iterable[T]) -> List[T]:
+def window_sum(iterable: Iterable[Number], size: int) -> Iterator[Number]:
+    """
+    Compute the sum of every window of 'size' consecutive values.
+
+    The running total is updated incrementally (add the incoming value,
+    subtract the outgoing one) instead of re-summing each window. Float
+    totals are tracked exactly, so each result equals ``math.fsum`` of its
+    window (or ±inf if that sum overflows), and an inf or NaN only affects
+    the windows that contain it.
+
+    Args:
+        iterable: The values to process.
+        size: The number of values in each window.
+
+    Yields:
+        The sum of each full window.
+
+    Examples:
+        >>> list(window_sum([1, 2, 3, 4, 5], 3))
+        [6, 9, 12]
+        >>> list(window_sum([1e16, 1.0, 1.0, 1.0], 2))
+        [1e+16, 2.0, 2.0]
+    """
+    if size <= 0:
+        raise ValueError("Window size must be positive")
+
+    items: deque = deque()
+    total = _WindowTotal()
+    for value in iterable:
+        items.append(value)
+        total.update(value, 1)
+        if len(items) > size:
+            total.update(items.popleft(), -1)
+        if len(items) == size:
+            yield total.value()
+
+
+def window_mean(iterable: Iterable[Number], size: int) -> Iterator[float]:
+    """
+    Compute the mean of every window of 'size' consecutive values.
+
+    Args:
+        iterable: The values to process.
+        size: The number of values in each window.
+
+    Yields:
+        The mean of each full window.
+
+    Examples:
+        >>> list(window_mean([1, 2, 3, 4, 5], 2))
+        [1.5, 2.5, 3.5, 4.5]
+    """
+    for total in window_sum(iterable, size):
+        yield total / size
+
+
+def _window_extreme(
+    iterable: Iterable[Number], size: int, better: Callable[[Any, Any], bool]
+) -> Iterator[Number]:
+    if size <= 0:
+        raise ValueError("Window size must be positive")
+
+    # Monotonic deque of (index, value): the front is the current extreme and
+    # values that can never become the extreme again are dropped on arrival.
+    candidates: deque = deque()
+    for index, value in enumerate(iterable):
+        while candidates and not better(candidates[-1][1], value):
+            candidates.pop()
+        candidates.append((index, value))
+        if candidates[0][0] <= index - size:
+            candidates.popleft()
+        if index >= size - 1:
+            yield candidates[0][1]
+
+
+def window_min(iterable: Iterable[Number], size: int) -> Iterator[Number]:
+    """
+    Compute the minimum of every window of 'size' consecutive values.
+
+    Uses a monotonic deque, so each value is processed in amortized O(1).
+
+    Args:
+        iterable: The values to process.
+        size: The number of values in each window.
+
+    Yields:
+        The minimum of each full window.
+
+    Examples:
+        >>> list(window_min([4, 2, 3, 1, 5], 2))
+        [2, 2, 1, 1]
+    """
+    return _window_extreme(iterable, size, lt)
+
+
+def window_max(iterable: Iterable[Number], size: int) -> Iterator[Number]:
+    """
+    Compute the maximum of every window of 'size' consecutive values.
+
+    Uses a monotonic deque, so each value is processed in amortized O(1).
+
+    Args:
+        iterable: The values to process.
+        size: The number of values in each window.
+
+    Yields:
+        The maximum of each full window.
+
+    Examples:
+        >>> list(window_max([4, 2, 3, 1, 5], 2))
+        [4, 3, 3, 5]
+    """
+    return _window_extreme(iterable, size, gt)
+
+
+_FINGERPRINT = object()
+_FINGERPRINT_MEMO_SIZE = 4096
+
+
+def _leaf_bytes(value: Any) -> bytes:
+    """
+    Encode a scalar so that values comparing equal get the same bytes.
+
+    Every encoding starts with its own tag byte and is self-delimiting
+    (length-prefixed, or ended by ";" for numbers), so the encodings of a
+    container's children can be concatenated without ambiguity.
+    """
+    if value is None:
+        return b"n"
+    if isinstance(value, str):
+        data = value.encode("utf-8", "surrogatepass")
+        return b"s%d:%b" % (len(data), data)
+    if isinstance(value, (bytes, bytearray)):
+        return b"b%d:%b" % (len(value), value)
+    if isinstance(value, _NumberABC):
+        # Equal numbers of any type (1 == 1.0 == True, 0.5 == Fraction(1, 2),
+        # 0.0 == -0.0) share one form: an integer, else a float, else repr.
+        if isinstance(value, complex) and value.imag == 0:
+            value = value.real
+        try:
+            as_int = int(value)
+            if as_int == value:
+                return b"i%d;" % as_int
+            as_float = float(value)
+            if as_float == value:
+                return b"f%b;" % as_float.hex().encode()
+        except (TypeError, ValueError, OverflowError):
+            pass
+        if isinstance(value, float):  # nan
+            return b"f%b;" % value.hex().encode()
+    name = type(value).__qualname__.encode()
+    text = repr(value).encode("utf-8", "surrogatepass")
+    return b"o%d:%b%d:%b" % (len(name), name, len(text), text)
+
+
+_CONTAINER_TYPES = (Mapping, list, tuple, set, frozenset)
+
+
+def _encode(value: Any, memo: Dict[int, Tuple[Any, bytes]]) -> bytes:
+    """Return the bytes that stand for 'value' inside its parent's digest."""
+    cls = type(value)
+    # Fast paths for the most common leaves of JSON-like records
+    if cls is str:
+        data = value.encode("utf-8", "surrogatepass")
+        return b"s%d:%b" % (len(data), data)
+    if cls is int:
+        return b"i%d;" % value
+    if cls is float and value.is_integer():
+        return b"i%d;" % value
+    if cls is float and value == value:
+        return b"f%b;" % value.hex().encode()
+    if cls is dict or cls is list or isinstance(value, _CONTAINER_TYPES):
+        return b"c" + _fingerprint(value, memo)
+    return _leaf_bytes(value)
+
+
+def _fingerprint(value: Any, memo: Dict[int, Tuple[Any, bytes]]) -> bytes:
+    """
+    Return a 16-byte canonical digest of a (possibly unhashable) value.
+
+    Only containers get a digest of their own; scalar leaves are encoded
+    straight into the digest of the container holding them.
+    """
+    cls = type(value)
+    container = cls is dict or cls is list or isinstance(value, _CONTAINER_TYPES)
+    if container:
+        cached = memo.get(id(value))
+        if cached is not None:
+            return cached[1]
+
+    if cls is dict or isinstance(value, Mapping):
+        # Sorting the pair encodings makes the result independent of key order
+        pairs = sorted(_encode(k, memo) + _encode(v, memo) for k, v in value.items())
+        data = b"D" + b"".join(pairs)
+    elif isinstance(value, (set, frozenset)):
+        data = b"S" + b"".join(sorted(_encode(item, memo) for item in value))
+    elif cls is list or isinstance(value, (list, tuple)):
+        data = (b"L" if isinstance(value, list) else b"T") + b"".join(
+            [_encode(item, memo) for item in value]
+        )
+    else:
+        data = _leaf_bytes(value)
+
+    result = blake2b(data, digest_size=16).digest()
+    if container:
+        # The memo holds a reference to each value so its id() cannot be reused
+        if len(memo) >= _FINGERPRINT_MEMO_SIZE:
+            memo.clear()
+        memo[id(value)] = (value, result)
+    return result
+
+
+def unique(
+    iterable: Iterable[T],
+    key: Optional[Callable[[T], Any]] = None,
+    canonical: bool = True,
+) -> List[T]:
     """
     Return unique elements from an iterable while preserving order.
 
+    Unhashable elements (dicts, lists, nested JSON-like records) are compared
+    through a canonical fingerprint: a fixed-size digest of their contents
+    that ignores dict key order. Digests of shared sub-objects are memoized.
+    Fingerprints follow ``==`` for None, strings, bytes and numbers
+    (``[1]`` matches ``[1.0]``, ``{"a": 0.0}`` matches ``{"a": -0.0}``) but
+    lists never match tuples. Other scalars inside unhashable values are
+    compared by type and ``repr``, and all NaNs are treated as equal.
+
     Args:
         iterable: The iterable to process.
+        key: Function computing the value to compare (default: the element).
+        canonical: Fingerprint unhashable values instead of raising TypeError
+            (default: True).
 
     Returns:
         A list with unique elements in original order.
@@ -76,15 +459,29 @@ def unique(iterable: Iterable[T]) -> List[T]:
         [1, 2, 3, 4]
         >>> unique("abracadabra")
         ['a', 'b', 'r', 'c', 'd']
+        >>> unique([{"a": 1, "b": 2}, {"b": 2, "a": 1}, [1]])
+        [{'a': 1, 'b': 2}, [1]]
+        >>> unique(["a", "B", "b"], key=str.lower)
+        ['a', 'B']
         >>> unique([])
         []
     """
     seen = set()
+    memo: Dict[int, Tuple[Any, bytes]] = {}
     result = []
     for item in iterable:
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
+        k = item if key is None else key(item)
+        try:
+            if k in seen:
+                continue
+        except TypeError:
+            if not canonical:
+                raise
+            k = (_FINGERPRINT, _fingerprint(k, memo))
+            if k in seen:
+                continue
+        seen.add(k)
+        result.append(item)
     return result
 
 
@@ -0,0 +1,381 @@
+"""Columnar batch utilities.
+
+Apply ``usefull`` functions to a whole column in one call instead of once per
+row. Supported functions have batch kernels that validate arguments and bind
+compiled patterns and methods once, then run without a Python function call
+per row; ``slugify`` even folds the whole column to ASCII in one go. Kernels
+reuse the helpers of the scalar functions, so both always agree. Any other
+callable falls back to a plain per-value loop.
+
+Nulls are tracked with an Arrow-style validity bitmap (one bit per row, least
+significant bit first). Kernels only see the runs of valid rows, which are
+copied out by slicing rather than checked for ``None`` row by row.
+"""
+
+from array import array, typecodes
+from itertools import chain, repeat
+from operator import methodcaller
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from usefull.numeric import (
+    _check_precision,
+    _check_range,
+    _check_total,
+    _percentage,
+    _round_to,
+    clamp,
+    percentage,
+    round_to,
+)
+from usefull.text import (
+    _NON_ALNUM,
+    _NON_ALNUM_LINE,
+    _ascii_lower,
+    slugify,
+    truncate,
+    word_count,
+)
+from usefull.validation import (
+    _EMAIL_PATTERN,
+    _URL_PATTERN,
+    is_email,
+    is_empty,
+    is_url,
+)
+
+Values = Union[List[Any], array, memoryview]
+
+
+class Column:
+    """
+    A column of values with an optional validity bitmap.
+
+    Args:
+        values: The column values (a list, ``array.array`` or ``memoryview``).
+        validity: Arrow-style bitmap marking valid rows, or None if every row
+            is valid.
+
+    Examples:
+        >>> column = Column([1, 2, 3], validity=bytearray([0b101]))
+        >>> column.to_list()
+        [1, None, 3]
+        >>> column.null_count
+        1
+    """
+
+    __slots__ = ("values", "validity")
+
+    def __init__(self, values: Values, validity: Optional[bytearray] = None) -> None:
+        self.values = values
+        self.validity = validity
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.validity is None:
+            return iter(self.values)
+        return (
+            value if self.is_valid(index) else None
+            for index, value in enumerate(self.values)
+        )
+
+    def __repr__(self) -> str:
+        return f"Column({self.to_list()!r})"
+
+    def is_valid(self, index: int) -> bool:
+        """Return True if the row at 'index' is not null."""
+        if self.validity is None:
+            return True
+        return bool(self.validity[index >> 3] >> (index & 7) & 1)
+
+    @property
+    def null_count(self) -> int:
+        """The number of null rows."""
+        if self.validity is None:
+            return 0
+        return len(self) - sum(map(self.is_valid, range(len(self))))
+
+    def to_list(self) -> List[Any]:
+        """Return the column as a list, with None for null rows."""
+        return list(self)
+
+
+def _bitmap_from_values(values: List[Any]) -> Optional[bytearray]:
+    """Build a validity bitmap marking non-None values, or None if all are valid."""
+    # list.index scans in C; Python only runs once per null
+    find = values.index
+    try:
+        index = find(None)
+    except ValueError:
+        return None
+    length = len(values)
+    bitmap = bytearray(b"\xff") * ((length + 7) >> 3)
+    if length & 7:
+        bitmap[-1] = (1 << (length & 7)) - 1
+    while True:
+        if values[index] is None:
+            bitmap[index >> 3] ^= 1 << (index & 7)
+        try:
+            index = find(None, index + 1)
+        except ValueError:
+            return bitmap
+
+
+def _valid_runs(validity: bytes, length: int) -> List[Tuple[int, int]]:
+    """Return the (start, stop) ranges of valid rows, skipping whole bytes at once."""
+    runs = []
+    start = -1
+    for byte_index, byte in enumerate(validity[: (length + 7) >> 3]):
+        if byte == 0xFF:
+            if start < 0:
+                start = byte_index << 3
+        elif byte == 0:
+            if start >= 0:
+                runs.append((start, byte_index << 3))
+                start = -1
+        else:
+            base = byte_index << 3
+            for bit in range(8):
+                if byte >> bit & 1:
+                    if start < 0:
+                        start = base + bit
+                elif start >= 0:
+                    runs.append((start, base + bit))
+                    start = -1
+    if start >= 0:
+        runs.append((start, length))
+    return [(begin, min(end, length)) for begin, end in runs if begin < length]
+
+
+def as_column(data: Any, validity: Optional[bytes] = None) -> Column:
+    """
+    Wrap column-like data in a Column without copying buffers where possible.
+
+    Lists and other iterables are scanned once for None to build the validity
+    bitmap. ``array.array`` and buffer-protocol objects (e.g. NumPy arrays) are
+    used as-is; pass 'validity' to attach an Arrow-style null bitmap to them.
+    Objects providing ``to_pylist()`` (e.g. Arrow arrays) are converted first.
+
+    Args:
+        data: The column data.
+        validity: Optional validity bitmap, one bit per row (LSB first).
+
+    Returns:
+        A Column over the data.
+
+    Examples:
+        >>> as_column(["a", None, "c"]).null_count
+        1
+        >>> as_column(array("d", [1.0, 2.0])).values
+        array('d', [1.0, 2.0])
+    """
+    if isinstance(data, Column):
+        return data
+    bitmap = None if validity is None else bytearray(validity)
+    if hasattr(data, "to_pylist"):
+        data = data.to_pylist()
+
+    values: Values
+    if isinstance(data, array):
+        values = data
+    elif isinstance(data, list):
+        values = data
+    else:
+        try:
+            values = memoryview(data)
+        except TypeError:
+            values = list(data)
+        else:
+            if values.ndim != 1:
+                raise ValueError("Column data must be one-dimensional")
+
+    if bitmap is None and isinstance(values, list):
+        bitmap = _bitmap_from_values(values)
+    elif bitmap is not None and len(bitmap) < (len(values) + 7) >> 3:
+        raise ValueError("validity bitmap is shorter than the column")
+    return Column(values, bitmap)
+
+
+def _slugify_kernel(values: Sequence[str], separator: str = "-") -> List[str]:
+    try:
+        text = "\n".join(values)
+    except TypeError:
+        text = None
+    if text is None or text.count("\n") != len(values) - 1 or "\n" in separator:
+        # Line breaks inside values (or non-str values) rule out the one-pass path
+        sub = _NON_ALNUM.sub
+        return [sub(separator, _ascii_lower(value)).strip(separator) for value in values]
+    # Fold the whole column at once, then split it back into rows
+    lines = _NON_ALNUM_LINE.sub(separator, _ascii_lower(text)).split("\n")
+    return list(map(str.strip, lines, repeat(separator)))
+
+
+def _truncate_kernel(
+    values: Sequence[str], max_length: int, suffix: str = "..."
+) -> List[str]:
+    # Inlined truncate: same expression, without a function call per value
+    keep = max_length - len(suffix)
+    return [
+        text if len(text) <= max_length else text[:keep] + suffix for text in values
+    ]
+
+
+def _word_count_kernel(values: Sequence[str]) -> List[int]:
+    return list(map(len, map(methodcaller("split"), values)))
+
+
+def _is_email_kernel(values: Sequence[str]) -> List[bool]:
+    match = _EMAIL_PATTERN.match
+    # Every match contains "@"; the substring test rejects most non-addresses
+    # far more cheaply than starting the regex engine
+    return ["@" in value and match(value) is not None for value in values]
+
+
+def _is_url_kernel(values: Sequence[str]) -> List[bool]:
+    match = _URL_PATTERN.match
+    # Every match contains "://", as for "@" in _is_email_kernel
+    return ["://" in value and match(value) is not None for value in values]
+
+
+def _is_empty_kernel(values: Sequence[Any]) -> List[bool]:
+    # is_empty's exact-type handler dict does the dispatch; map keeps the loop in C
+    return list(map(is_empty, values))
+
+
+def _clamp_kernel(values: Sequence[Any], min_value: Any, max_value: Any) -> List[Any]:
+    _check_range(min_value, max_value)
+    # Inlined _clamp, max(min_value, min(value, max_value)), with the same
+    # comparisons in the same order but no builtin calls per value
+    top = max_value if max_value > min_value else min_value
+    return [
+        top if max_value < value else value if value > min_value else min_value
+        for value in values
+    ]
+
+
+def _round_to_kernel(values: Sequence[Any], precision: Any) -> List[float]:
+    _check_precision(precision)
+    return [_round_to(value, precision) for value in values]
+
+
+def _percentage_kernel(values: Sequence[Any], total: Any) -> List[float]:
+    _check_total(total)
+    return [_percentage(value, total) for value in values]
+
+
+# Maps a usefull function to its batch kernel, output kind and null result.
+# The kind is "bool", "int" or "float" for typed arrays, "same" to keep the
+# input's array typecode when possible, or "object" for a plain list. The null
+# result is the answer for null rows of functions that define one (a null is
+# empty); None keeps null rows null.
+_KERNELS: Dict[Callable[..., Any], Tuple[Callable[..., List[Any]], str, Any]] = {
+    slugify: (_slugify_kernel, "object", None),
+    truncate: (_truncate_kernel, "object", None),
+    word_count: (_word_count_kernel, "int", None),
+    is_email: (_is_email_kernel, "bool", None),
+    is_url: (_is_url_kernel, "bool", None),
+    is_empty: (_is_empty_kernel, "bool", True),
+    clamp: (_clamp_kernel, "same", None),
+    round_to: (_round_to_kernel, "float", None),
+    percentage: (_percentage_kernel, "float", None),
+}
+
+_TYPECODES = {"bool": "b", "int": "q", "float": "d"}
+
+
+def _typed(results: List[Any], kind: str, source: Values) -> Values:
+    if kind == "bool":
+        # bytes() packs a list of bools in C; frombytes is a plain memcpy
+        typed = array("b")
+        typed.frombytes(bytes(results))
+        return typed
+    if kind == "same":
+        typecode = getattr(source, "typecode", None) or getattr(source, "format", None)
+    else:
+        typecode = _TYPECODES.get(kind)
+    if typecode is None or typecode not in typecodes:
+        return results
+    try:
+        return array(typecode, results)
+    except (TypeError, OverflowError):
+        return results
+
+
+def apply(func: Callable[..., Any], data: Any, *args: Any, **kwargs: Any) -> Column:
+    """
+    Apply a function to every value of a column.
+
+    The column is passed as the function's first argument; 'args' and
+    'kwargs' are passed unchanged to every call. Null rows are skipped and
+    stay null in the result, except for functions that define an answer for
+    them: ``is_empty`` reports null rows as empty.
+
+    Args:
+        func: The function to apply, e.g. ``slugify``, ``is_email`` or ``clamp``.
+        data: The column (anything accepted by ``as_column``).
+        *args: Extra positional arguments for 'func'.
+        **kwargs: Extra keyword arguments for 'func'.
+
+    Returns:
+        A Column of results: an ``array.array`` for boolean and numeric
+        results, a list otherwise.
+
+    Examples:
+        >>> apply(slugify, ["Hello World!", None]).to_list()
+        ['hello-world', None]
+        >>> apply(is_email, ["user@example.com", "nope"]).values
+        array('b', [1, 0])
+        >>> apply(clamp, array("i", [-5, 5, 15]), 0, 10).values
+        array('i', [0, 5, 10])
+        >>> apply(is_empty, [None, "", "x"]).values
+        array('b', [1, 1, 0])
+    """
+    if func in _KERNELS:
+        kernel, kind, null_result = _KERNELS[func]
+    else:
+
+        def kernel(batch: Sequence[Any], *args: Any, **kwargs: Any) -> List[Any]:
+            return [func(value, *args, **kwargs) for value in batch]
+
+        kind = "object"
+        null_result = None
+
+    if null_result is not None and isinstance(data, list):
+        # The kernel answers for None itself; no need to look for nulls
+        return Column(_typed(kernel(data, *args, **kwargs), kind, data), None)
+
+    column = as_column(data)
+    values = column.values
+    validity = column.validity
+    if validity is None:
+        results = kernel(values, *args, **kwargs)
+    else:
+        runs = _valid_runs(validity, len(values))
+        computed = kernel(
+            list(chain.from_iterable(values[start:stop] for start, stop in runs)),
+            *args,
+            **kwargs,
+        )
+        if null_result is not None:
+            fill, validity = null_result, None
+        else:
+            fill, validity = None if kind == "object" else 0, bytearray(validity)
+        results = []
+        done = 0
+        for start, stop in runs:
+            results.extend(repeat(fill, start - len(results)))
+            results.extend(computed[done : done + stop - start])
+            done += stop - start
+        results.extend(repeat(fill, len(values) - len(results)))
+    return Column(_typed(results, kind, values), validity)
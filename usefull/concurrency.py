@@ -0,0 +1,173 @@
+"""Thread-safe accumulators for sharing state across threads.
+
+The per-call ``seen`` set of ``unique`` and the dict built by ``group_by``
+cannot be shared between threads. The classes here are concurrent versions
+of them: state is split into shards, each guarded by its own lock, and an
+item only locks the shard its hash falls into. Threads working on different
+keys therefore rarely contend, and no operation on a single item takes a
+global lock. The locking is explicit, so the classes stay correct on
+free-threaded (no-GIL) builds of Python 3.13+.
+"""
+
+import os
+import threading
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+def _spread(h: int) -> int:
+    """Mix high hash bits into the low bits that select a shard."""
+    return h ^ (h >> 16)
+
+
+def _shard_count(shards: Optional[int]) -> int:
+    """Round 'shards' up to a power of two so a bit mask selects the shard."""
+    if shards is None:
+        shards = 4 * (os.cpu_count() or 1)
+    if shards <= 0:
+        raise ValueError("shards must be positive")
+    return 1 << (shards - 1).bit_length()
+
+
+class ConcurrentSeenSet(Generic[T]):
+    """
+    A lock-striped set for deduplicating items across threads.
+
+    Args:
+        shards: Number of independently locked shards, rounded up to a power
+            of two (default: four per CPU).
+
+    Examples:
+        >>> seen = ConcurrentSeenSet()
+        >>> seen.add("a"), seen.add("a")
+        (True, False)
+        >>> list(seen.filter_new(["a", "b", "b", "c"]))
+        ['b', 'c']
+        >>> len(seen)
+        3
+    """
+
+    def __init__(self, shards: Optional[int] = None) -> None:
+        count = _shard_count(shards)
+        self._mask = count - 1
+        self._sets: List[Set[T]] = [set() for _ in range(count)]
+        self._locks = [threading.Lock() for _ in range(count)]
+
+    def add(self, item: T) -> bool:
+        """
+        Add an item, returning True if no thread had added it before.
+
+        The check and the insertion happen atomically, so among concurrent
+        callers adding the same item exactly one receives True.
+        """
+        index = _spread(hash(item)) & self._mask
+        shard = self._sets[index]
+        with self._locks[index]:
+            if item in shard:
+                return False
+            shard.add(item)
+            return True
+
+    def discard(self, item: T) -> None:
+        """Remove an item if present."""
+        index = _spread(hash(item)) & self._mask
+        with self._locks[index]:
+            self._sets[index].discard(item)
+
+    def filter_new(self, iterable: Iterable[T]) -> Iterator[T]:
+        """Yield the items of 'iterable' that no thread has added yet, adding them."""
+        add = self.add
+        for item in iterable:
+            if add(item):
+                yield item
+
+    def clear(self) -> None:
+        """Remove every item."""
+        for lock, shard in zip(self._locks, self._sets):
+            with lock:
+                shard.clear()
+
+    def __contains__(self, item: object) -> bool:
+        index = _spread(hash(item)) & self._mask
+        with self._locks[index]:
+            return item in self._sets[index]
+
+    def __len__(self) -> int:
+        total = 0
+        for lock, shard in zip(self._locks, self._sets):
+            with lock:
+                total += len(shard)
+        return total
+
+
+class ConcurrentGrouper(Generic[T, K]):
+    """
+    A lock-striped ``group_by`` that many threads can feed at once.
+
+    Elements of one group keep the order in which they were added; the order
+    of elements added concurrently by different threads is unspecified.
+
+    Args:
+        key: Function that returns the group key for each element.
+        shards: Number of independently locked shards, rounded up to a power
+            of two (default: four per CPU).
+
+    Examples:
+        >>> grouper = ConcurrentGrouper(lambda x: x % 2)
+        >>> grouper.extend([1, 2, 3, 4, 5])
+        >>> sorted(grouper.groups().items())
+        [(0, [2, 4]), (1, [1, 3, 5])]
+    """
+
+    def __init__(self, key: Callable[[T], K], shards: Optional[int] = None) -> None:
+        count = _shard_count(shards)
+        self.key = key
+        self._mask = count - 1
+        self._dicts: List[Dict[K, List[T]]] = [{} for _ in range(count)]
+        self._locks = [threading.Lock() for _ in range(count)]
+
+    def add(self, item: T) -> None:
+        """Add an item to the group of its key."""
+        k = self.key(item)
+        index = _spread(hash(k)) & self._mask
+        groups = self._dicts[index]
+        with self._locks[index]:
+            group = groups.get(k)
+            if group is None:
+                groups[k] = [item]
+            else:
+                group.append(item)
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        """Add every item of an iterable."""
+        add = self.add
+        for item in iterable:
+            add(item)
+
+    def groups(self) -> Dict[K, List[T]]:
+        """Return a snapshot of the groups as a plain dictionary."""
+        result: Dict[K, List[T]] = {}
+        for lock, groups in zip(self._locks, self._dicts):
+            with lock:
+                for k, group in groups.items():
+                    result[k] = list(group)
+        return result
+
+    def __len__(self) -> int:
+        total = 0
+        for lock, groups in zip(self._locks, self._dicts):
+            with lock:
+                total += len(groups)
+        return total
@@ -27,8 +27,16 @@ def clamp(value: Number, min_value: Number, max_value: Number) -> Number:
         >>> clamp(3.5, 0.0, 5.0)
         3.5
     """
+    _check_range(min_value, max_value)
+    return _clamp(value, min_value, max_value)
+
+
+def _check_range(min_value: Number, max_value: Number) -> None:
     if min_value > max_value:
         raise ValueError("min_value must be less than or equal to max_value")
+
+
+def _clamp(value: Number, min_value: Number, max_value: Number) -> Number:
     return max(min_value, min(value, max_value))
 
 
@@ -78,8 +86,16 @@ def round_to(value: Number, precision: Number) -> float:
         >>> round_to(127, 10)
         130.0
     """
+    _check_precision(precision)
+    return _round_to(value, precision)
+
+
+def _check_precision(precision: Number) -> None:
     if precision <= 0:
         raise ValueError("precision must be positive")
+
+
+def _round_to(value: Number, precision: Number) -> float:
     return round(value / precision) * precision
 
 
@@ -104,6 +120,14 @@ def percentage(value: Number, total: Number) -> float:
         >>> percentage(50, 200)
         25.0
     """
+    _check_total(total)
+    return _percentage(value, total)
+
+
+def _check_total(total: Number) -> None:
     if total == 0:
         raise ValueError("total cannot be zero")
+
+
+def _percentage(value: Number, total: Number) -> float:
     return float(value / total * 100)
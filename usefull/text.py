@@ -4,6 +4,18 @@ import re
 import unicodedata
 from typing import Optional
 
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+# The same runs, but never across line breaks; used to slugify many lines at once
+_NON_ALNUM_LINE = re.compile(r"[^a-z0-9\n]+")
+
+
+def _ascii_lower(text: str) -> str:
+    """Fold text to lowercase ASCII, dropping what has no ASCII equivalent."""
+    # Every step works character by character, so folding "\n".join(texts)
+    # gives the same lines as folding each text on its own
+    text = unicodedata.normalize("NFKD", text)
+    return text.encode("ascii", "ignore").decode("ascii").lower()
+
 
 def slugify(text: str, separator: str = "-") -> str:
     """
@@ -24,13 +36,10 @@ def slugify(text: str, separator: str = "-") -> str:
         >>> slugify("Привет мир")
         'privet-mir'
     """
-    # Normalize unicode characters to ASCII equivalents
-    text = unicodedata.normalize("NFKD", text)
-    text = text.encode("ascii", "ignore").decode("ascii")
-    # Convert to lowercase
-    text = text.lower()
+    # Normalize unicode characters to lowercase ASCII equivalents
+    text = _ascii_lower(text)
     # Replace non-alphanumeric characters with separator
-    text = re.sub(r"[^a-z0-9]+", separator, text)
+    text = _NON_ALNUM.sub(separator, text)
     # Remove leading/trailing separators
     text = text.strip(separator)
     return text
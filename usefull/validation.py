@@ -1,7 +1,15 @@
 """Validation utilities."""
 
 import re
-from typing import Any
+from collections.abc import Iterator, Mapping, Sized
+from functools import singledispatch
+from operator import length_hint
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Set
+
+from usefull.collections import chunk
+
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_URL_PATTERN = re.compile(r"^(https?|ftp)://[^\s/$.?#].[^\s]*$", re.IGNORECASE)
 
 
 def is_email(value: str) -> bool:
@@ -22,8 +30,7 @@ def is_email(value: str) -> bool:
         >>> is_email("user.name+tag@domain.co.uk")
         True
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, value))
+    return _EMAIL_PATTERN.match(value) is not None
 
 
 def is_url(value: str) -> bool:
@@ -46,13 +53,95 @@ def is_url(value: str) -> bool:
         >>> is_url("ftp://files.example.com")
         True
     """
-    pattern = r"^(https?|ftp)://[^\s/$.?#].[^\s]*$"
-    return bool(re.match(pattern, value, re.IGNORECASE))
+    return _URL_PATTERN.match(value) is not None
+
+
+@singledispatch
+def _is_empty_dispatch(value: Any) -> bool:
+    if isinstance(value, Iterator):
+        return length_hint(value, -1) == 0
+    return False
+
+
+@_is_empty_dispatch.register(type(None))
+def _is_empty_none(value: None) -> bool:
+    return True
+
+
+@_is_empty_dispatch.register(str)
+def _is_empty_str(value: str) -> bool:
+    return not value or value.isspace()
+
+
+@_is_empty_dispatch.register(list)
+@_is_empty_dispatch.register(tuple)
+@_is_empty_dispatch.register(dict)
+@_is_empty_dispatch.register(set)
+@_is_empty_dispatch.register(frozenset)
+@_is_empty_dispatch.register(bytes)
+@_is_empty_dispatch.register(bytearray)
+@_is_empty_dispatch.register(range)
+def _is_empty_builtin(value: Sized) -> bool:
+    return len(value) == 0
+
+
+@_is_empty_dispatch.register(int)
+@_is_empty_dispatch.register(float)
+@_is_empty_dispatch.register(complex)
+def _is_empty_scalar(value: Any) -> bool:
+    return False
+
+
+@_is_empty_dispatch.register(Sized)
+def _is_empty_sized(value: Sized) -> bool:
+    size = getattr(value, "size", None)
+    if isinstance(size, int) and hasattr(value, "shape"):
+        return size == 0
+    return len(value) == 0
+
+
+# Exact-type handler cache in front of the singledispatch registry: a plain
+# dict lookup is much cheaper than singledispatch's WeakKeyDictionary. Types
+# missing here are resolved through the registry (subclasses, ABCs) once.
+_EMPTY_HANDLERS: Dict[type, Callable[[Any], bool]] = {
+    type(None): _is_empty_none,
+    str: _is_empty_str,
+    list: _is_empty_builtin,
+    tuple: _is_empty_builtin,
+    dict: _is_empty_builtin,
+    set: _is_empty_builtin,
+    frozenset: _is_empty_builtin,
+    bytes: _is_empty_builtin,
+    bytearray: _is_empty_builtin,
+    range: _is_empty_builtin,
+    int: _is_empty_scalar,
+    bool: _is_empty_scalar,
+    float: _is_empty_scalar,
+    complex: _is_empty_scalar,
+}
+
+
+def _empty_handler(cls: type) -> Callable[[Any], bool]:
+    """Resolve and cache the emptiness handler for a type."""
+    handler = _EMPTY_HANDLERS.get(cls)
+    if handler is None:
+        handler = _EMPTY_HANDLERS[cls] = _is_empty_dispatch.dispatch(cls)
+    return handler
 
 
 def is_empty(value: Any) -> bool:
     """
-    Check if a value is "empty" (None, empty string, empty collection).
+    Check if a value is "empty" (None, blank string, empty collection).
+
+    Handlers are looked up by exact type in a dict, falling back to a
+    ``functools.singledispatch`` registry for subclasses and ABCs.
+    Additional types can be registered with ``is_empty.register``; ``None``
+    and ``str`` are checked inline and cannot be overridden.
+
+    Sized objects (bytes, range, custom containers) are empty when their
+    length is zero; array-like objects exposing ``shape`` and ``size``
+    (e.g. NumPy arrays) are empty when ``size`` is zero. Iterators are never
+    consumed: they are only reported empty when their length hint is zero.
 
     Args:
         value: The value to check.
@@ -71,6 +160,8 @@ def is_empty(value: Any) -> bool:
         True
         >>> is_empty({})
         True
+        >>> is_empty(b"")
+        True
         >>> is_empty(0)
         False
         >>> is_empty("hello")
@@ -78,8 +169,102 @@ def is_empty(value: Any) -> bool:
     """
     if value is None:
         return True
-    if isinstance(value, str):
-        return not value.strip()
-    if isinstance(value, (list, tuple, dict, set)):
-        return len(value) == 0
-    return False
+    cls = value.__class__
+    if cls is str:
+        # isspace() inspects the string in place instead of copying it via strip()
+        return not value or value.isspace()
+    handler = _EMPTY_HANDLERS.get(cls)
+    if handler is None:
+        handler = _empty_handler(cls)
+    return handler(value)
+
+
+def _register_empty(cls: type, func: Optional[Callable[[Any], bool]] = None) -> Any:
+    """Register an emptiness handler for 'cls' (usable as a decorator)."""
+    if cls is str or cls is type(None):
+        raise ValueError(f"the emptiness of {cls.__name__} cannot be overridden")
+    if func is None:
+        return lambda f: _register_empty(cls, f)
+    _is_empty_dispatch.register(cls, func)
+    # Cached handlers may have been resolved for subclasses of 'cls'
+    _EMPTY_HANDLERS.clear()
+    _EMPTY_HANDLERS.update(_BUILTIN_HANDLERS)
+    return func
+
+
+_BUILTIN_HANDLERS = dict(_EMPTY_HANDLERS)
+is_empty.register = _register_empty  # type: ignore[attr-defined]
+
+
+_COUNT_BLOCK_SIZE = 4096
+_DEEP_SEQUENCES = (list, tuple, set, frozenset)
+
+
+def is_empty_deep(value: Any) -> bool:
+    """
+    Check if a value is empty, looking inside nested dicts and collections.
+
+    A container is deeply empty when every element (or every mapping value)
+    is itself deeply empty. The check stops at the first non-empty element,
+    and self-referencing containers are handled without recursing forever.
+
+    Args:
+        value: The value to check.
+
+    Returns:
+        True if the value contains nothing but empty values.
+
+    Examples:
+        >>> is_empty_deep({"a": None, "b": ["", {}]})
+        True
+        >>> is_empty_deep([[], [[0]]])
+        False
+        >>> is_empty_deep("  ")
+        True
+    """
+    return _is_empty_deep(value, set())
+
+
+def _is_empty_deep(value: Any, active: Set[int]) -> bool:
+    if isinstance(value, Mapping):
+        items: Iterable[Any] = value.values()
+    elif isinstance(value, _DEEP_SEQUENCES):
+        items = value
+    else:
+        return is_empty(value)
+    # A container already being checked further up adds nothing new
+    if id(value) in active:
+        return True
+    active.add(id(value))
+    try:
+        return all(_is_empty_deep(item, active) for item in items)
+    finally:
+        active.discard(id(value))
+
+
+def count_empty(
+    records: Iterable[Mapping[str, Any]], fields: Sequence[str]
+) -> Dict[str, int]:
+    """
+    Count empty values per field across a batch of records.
+
+    Missing fields count as empty. Records are processed in blocks, one
+    field column at a time, so the per-value work runs inside ``map``.
+
+    Args:
+        records: The records (mappings) to check.
+        fields: The field names to count.
+
+    Returns:
+        A dictionary mapping each field to its number of empty values.
+
+    Examples:
+        >>> count_empty([{"a": "", "b": 1}, {"a": "x"}], ["a", "b"])
+        {'a': 1, 'b': 1}
+    """
+    fields = tuple(fields)
+    counts = dict.fromkeys(fields, 0)
+    for block in chunk(records, _COUNT_BLOCK_SIZE):
+        for field in fields:
+            counts[field] += sum(map(is_empty, [record.get(field) for record in block]))
+    return counts